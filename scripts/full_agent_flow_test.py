@@ -4,9 +4,9 @@ Creates a agent, starts the analysis on another thread, and
 then prints messages as they are received, on main thread.
 """
 
-import queue
 import threading
 import sys
+import traceback
 from pathlib import Path
 
 from agent.agent import ModelOptions, create_agent
@@ -19,32 +19,39 @@ from agent.messaging.types import (
     ToolExecutionMessage,
 )
 
+SEPARATOR = "=" * 50
+
 
 def handle_print_message(message: AgentMessage):
+    # Build the whole block and print it once, rather than one print per line
     match message:
         case ToolExecutionMessage():
-            print("--- TOOL EXECUTION ---")
-            print(f"Tool: {message.tool_name}")
-            print(f"Arguments: {message.arguments}")
-            print(f"Result: {message.result}")
+            text = (
+                "--- TOOL EXECUTION ---\n"
+                f"Tool: {message.tool_name}\n"
+                f"Arguments: {message.arguments}\n"
+                f"Result: {message.result}"
+            )
         case StreamStartMessage():
-            print("--- STREAM START ---")
-            print(f"Content type: {message.content_type}")
+            text = f"--- STREAM START ---\nContent type: {message.content_type}"
+            if message.initial_content:
+                text += f"\nContent: {message.initial_content}"
         case StreamChunkMessage():
-            print("--- STREAM CHUNK ---")
-            print(f"Content: {message.content}")
+            text = f"--- STREAM CHUNK ---\nContent: {message.content}"
         case StreamEndMessage():
-            print("--- STREAM END ---")
-            print(f"Total chunks: {message.total_chunks}")
+            text = f"--- STREAM END ---\nTotal chunks: {message.total_chunks}"
         case BugReportMessage():
-            print("--- BUG REPORT ---")
-            print(f"Summary: {message.summary}")
-            print(f"Bugs: {message.bugs}")
+            text = (
+                "--- BUG REPORT ---\n"
+                f"Summary: {message.summary}\n"
+                f"Bugs: {message.bugs}"
+            )
         case _:
-            print(f"Unknown message type: {message.message_type}")
+            text = f"Unknown message type: {message.message_type}"
+    print(text)
 
 
-def run_agent_analysis(agent, stop_event):
+def run_agent_analysis(agent):
     """Run the agent analysis in a separate thread."""
     try:
         print("Starting agent sandbox...")
@@ -54,15 +61,13 @@ def run_agent_analysis(agent, stop_event):
         print("Agent analysis completed")
     except Exception as e:
         print(f"Agent analysis failed: {e}")
-        import traceback
-
         traceback.print_exc()
     finally:
         try:
             agent.stop()  # Clean up sandbox
         except Exception:
             pass
-        stop_event.set()
+        agent.receiver.close()
 
 
 def main():
@@ -72,21 +77,17 @@ def main():
     current_dir = Path(__file__).parent.parent
     codebase_path = str(current_dir / "assets" / "toy-webserver.zip")
 
-    print(f"Testing agent with codebase: {codebase_path}")
-    print("=" * 50)
+    print(f"Testing agent with codebase: {codebase_path}\n{SEPARATOR}")
 
     # Create agent and receiver
     agent, receiver = create_agent(
         codebase_path=codebase_path, model=ModelOptions.QWEN3_30B_A3B_INSTRUCT
     )
 
-    # Create stop event for coordination
-    stop_event = threading.Event()
-
     try:
         # Start agent analysis in background thread
         analysis_thread = threading.Thread(
-            target=run_agent_analysis, args=(agent, stop_event), daemon=True
+            target=run_agent_analysis, args=(agent,), daemon=True
         )
         analysis_thread.start()
 
@@ -94,47 +95,27 @@ def main():
         print("Listening for messages...")
         message_count = 0
 
-        while not stop_event.is_set() or not receiver.empty():
-            if not receiver.empty():
-                try:
-                    message = receiver.get_message_nowait()
-                    message_count += 1
-
-                    print(f"\n--- Message {message_count} ---")
-                    try:
-                        handle_print_message(message)
-                    except Exception as print_error:
-                        print(f"Error printing message: {print_error}")
-                        print(f"Message type: {getattr(message, 'message_type', 'unknown')}")
-
-                except queue.Empty:
-                    # Race condition - queue became empty between check and get
-                    pass
-                except Exception as e:
-                    print(f"Unexpected error receiving message: {e}")
-            else:
-                # No messages available, short sleep to avoid busy waiting
-                import time
-                time.sleep(0.1)
-
-            # Check if analysis thread is done and no more messages
-            if not analysis_thread.is_alive() and receiver.empty():
-                break
+        # Iteration ends once the analysis thread closes the receiver
+        for message in receiver:
+            message_count += 1
+
+            print(f"\n--- Message {message_count} ---")
+            try:
+                handle_print_message(message)
+            except Exception as print_error:
+                print(f"Error printing message: {print_error}")
+                print(f"Message type: {getattr(message, 'message_type', 'unknown')}")
 
         # Wait for analysis thread to complete
         analysis_thread.join(timeout=5.0)
 
-        print("\n" + "=" * 50)
-        print(f"Test completed! Processed {message_count} messages")
+        print(f"\n{SEPARATOR}\nTest completed! Processed {message_count} messages")
 
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
-        stop_event.set()
 
     except Exception as e:
         print(f"\nTest failed: {e}")
-        import traceback
-
         traceback.print_exc()
 
     finally:
@@ -4,12 +4,14 @@ SniffAgent - Simple, reliable code review agent using qwen models.
 
 import warnings
 
-from .agent import SniffAgent
-
-# Suppress third-party library warnings that we can't control
+# Suppress third-party library warnings that we can't control. This runs before
+# any submodule is imported, so it also covers qwen-agent being imported by
+# agent.tools.* directly.
 warnings.filterwarnings(
     "ignore", message="pkg_resources is deprecated", category=UserWarning
 )
 
+from .agent import SniffAgent
+
 # Export the main class
 __all__ = ["SniffAgent"]
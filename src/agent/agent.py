@@ -1,17 +1,14 @@
 """Clean agent implementation using the new messaging system."""
 
+import itertools
+import json
 import os
+import secrets
 import time
+from collections import defaultdict, deque
 from enum import Enum
 from typing import Tuple
 
-# MUST modify settings BEFORE importing Assistant to avoid import-time binding
-from qwen_agent import settings
-
-settings.MAX_LLM_CALL_PER_RUN = 500
-
-from qwen_agent.agents import Assistant
-
 from agent.messaging import (
     BugReportMessage,
     BugReportStartedMessage,
@@ -22,10 +19,29 @@ from agent.messaging import (
     ToolExecutionMessage,
 )
 from agent.sandbox import Sandbox
-from agent.tools import cat, glob, grep, load_prompt, ls, todoread, todowrite
+from agent.tools import load_prompt
 from tui.utils.json_detector import JSONDetector
 
 
+def _load_assistant():
+    """Import qwen-agent and register our tools on first use.
+
+    qwen-agent pulls in openai and its tokenizer, which takes seconds, while the
+    TUI imports this module at startup just for ModelOptions.
+    """
+    # MUST modify settings BEFORE importing Assistant to avoid import-time binding
+    from qwen_agent import settings
+
+    settings.MAX_LLM_CALL_PER_RUN = 500
+
+    from qwen_agent.agents import Assistant
+
+    # Importing the tool modules registers them with qwen-agent
+    from agent.tools import cat, glob, grep, ls, todoread, todowrite  # noqa: F401
+
+    return Assistant
+
+
 class ModelOptions(Enum):
     QWEN3_480B_A35B_CODER = "qwen/qwen3-coder"
     QWEN3_235B_A22B_INSTRUCT = "qwen/qwen3-235b-a22b-2507"
@@ -48,6 +64,26 @@ def create_agent(
 class SniffAgent:
     """Clean agent implementation with built-in messaging."""
 
+    # The streaming state is touched on every token; slots keep those lookups
+    # off the instance dict
+    __slots__ = (
+        "receiver",
+        "llm_agent",
+        "sandbox",
+        "messages",
+        "_response_cursor",
+        "_pending_tool_calls",
+        "_bug_report_started",
+        "_bug_report_sent",
+        "_analyzed_files",
+        "_current_stream",
+        "_stream_buffer",
+        "_chunk_index",
+        "_json_detector",
+        "_msg_id_prefix",
+        "_msg_id_counter",
+    )
+
     def __init__(
         self, codebase_path: str, model: ModelOptions, receiver: MessageReceiver
     ):
@@ -67,6 +103,7 @@ class SniffAgent:
         system_instruction = load_prompt("system_prompt")
         tools = ["ls", "cat", "grep", "glob", "todo_write", "todo_read"]
 
+        Assistant = _load_assistant()
         self.llm_agent = Assistant(
             llm=llm_cfg,
             system_message=system_instruction,
@@ -77,8 +114,10 @@ class SniffAgent:
         self.sandbox = Sandbox(codebase_path)
         self.messages = []
 
-        # Track sent tool executions to avoid duplicates
-        self._sent_tool_executions = set()
+        # Responses are cumulative across batches; only the tail past the
+        # cursor is new. Tool calls wait here (FIFO per tool) for their result.
+        self._response_cursor = 0
+        self._pending_tool_calls = defaultdict(deque)
 
         # Track bug report generation state
         self._bug_report_started = False
@@ -95,23 +134,23 @@ class SniffAgent:
         # JSON detection
         self._json_detector = JSONDetector()
 
+        # Message IDs only need to be unique within a run: a random per-agent
+        # prefix plus a counter avoids drawing a fresh UUID for every chunk
+        self._msg_id_prefix = secrets.token_hex(2)
+        self._msg_id_counter = itertools.count()
+
     def start(self):
         """Start the agent and its sandbox."""
+        # start() returns once the workspace is unpacked; nothing to wait for
         self.sandbox.start()
-        self._wait_for_workspace_ready()
-
-    def _wait_for_workspace_ready(self):
-        """Wait for sandbox to be ready."""
-        # Simple check - could be enhanced
-        import time
-
-        time.sleep(1)
 
     def run_analysis(self):
         """Run the bug analysis. Messages are sent to receiver in real-time."""
         try:
             # Send initial query
             self.messages = [{"role": "user", "content": load_prompt("starting_query")}]
+            self._response_cursor = 0
+            self._pending_tool_calls.clear()
 
             # Run LLM and process responses - messages sent in real-time
             llm_responses = self.llm_agent.run(messages=self.messages)
@@ -132,33 +171,26 @@ class SniffAgent:
         if not responses:
             return
 
-        # Find all complete tool call + result pairs
+        # Find tool call + result pairs completed since the last batch
         tool_calls_with_results = self._find_complete_tool_executions(responses)
 
-        # Send only new complete tool executions
+        # Each pair is found exactly once, so it can be sent straight away
         for tool_call, result in tool_calls_with_results:
-            tool_signature = self._get_tool_signature(tool_call, result)
-
-            if tool_signature not in self._sent_tool_executions:
-                self._send_tool_execution(tool_call, result)
-                self._sent_tool_executions.add(tool_signature)
+            self._send_tool_execution(tool_call, result)
 
         # Handle streaming content: Append tokens to the current message; start a new one when content resets
         last_content = None
-        for response in responses:
-            if (
-                isinstance(response, dict)
-                and "content" in response
-                and response["content"]
-                and response.get("role") != "function"
-            ):
-                last_content = response["content"]
+        for response in reversed(responses):
+            if isinstance(response, dict):
+                get = response.get
+                content = get("content")
+                if content and get("role") != "function":
+                    last_content = content
+                    break
 
         if last_content:
             self._handle_streaming_content(last_content)
 
-    # Removed: _send_batched_content (legacy)
-
     def _handle_streaming_content(self, content):
         """Handle streaming content with JSON detection."""
         split = self._json_detector.split_content(content)
@@ -175,7 +207,10 @@ class SniffAgent:
                 self._bug_report_started = True
 
             if split.is_complete_json and not self._bug_report_sent:
-                report_data = self._json_detector.parse_json(split.json_content)
+                # The split usually decoded the report already; reuse it
+                report_data = split.json_value
+                if report_data is None:
+                    report_data = self._json_detector.parse_json(split.json_content)
                 if report_data:
                     self._handle_bug_report_json(report_data)
                     self._bug_report_sent = True
@@ -208,17 +243,19 @@ class SniffAgent:
         self._stream_buffer = initial_content
         self._chunk_index = 0
 
+        # The initial content rides along with the start message and counts
+        # as the stream's first chunk
         self.receiver.receive_message(
             StreamStartMessage(
                 message_id=self._gen_msg_id(),
                 timestamp=time.time(),
                 content_type="analysis",
+                initial_content=initial_content,
             )
         )
 
-        # Send the initial content as first chunk
         if initial_content:
-            self._send_stream_chunk(initial_content)
+            self._chunk_index = 1
 
     def _send_stream_chunk(self, chunk_content):
         """Send a chunk of streaming content."""
@@ -249,57 +286,41 @@ class SniffAgent:
             self._chunk_index = 0
 
     def _find_complete_tool_executions(self, responses):
-        """Find tool calls that have corresponding function results."""
-        # Build maps of tool calls and function results
-        tool_calls = {}  # tool_name -> latest_tool_call_response
-        function_results = {}  # tool_name -> function_result_response
+        """Find tool calls whose results arrived since the last batch.
+
+        Only responses past the cursor are examined, so each batch costs time
+        proportional to what is new rather than to the whole transcript. The
+        last response may still be streaming, so it is left for the next batch
+        unless it is a function result (those are appended whole).
+        """
+        end = len(responses)
+        last = responses[-1]
+        if not (isinstance(last, dict) and last.get("role") == "function"):
+            end -= 1
 
-        for response in responses:
+        complete_executions = []
+        pending_calls = self._pending_tool_calls
+        for response in responses[self._response_cursor : end]:
             if not isinstance(response, dict):
                 continue
+            get = response.get
 
-            # Track latest tool call for each tool
-            if "function_call" in response and response["function_call"]:
-                func_call = response["function_call"]
+            # Queue tool calls until their result arrives
+            func_call = get("function_call")
+            if func_call:
                 tool_name = func_call.get("name", "")
                 if tool_name:
-                    tool_calls[tool_name] = response
-
-            # Track function results
-            elif response.get("role") == "function":
-                tool_name = response.get("name", "")
-                if tool_name:
-                    function_results[tool_name] = response
+                    pending_calls[tool_name].append(response)
 
-        # Return pairs where we have both call and result
-        complete_executions = []
-        for tool_name, tool_call in tool_calls.items():
-            if tool_name in function_results:
-                complete_executions.append((tool_call, function_results[tool_name]))
+            # Pair function results with the oldest outstanding call
+            elif get("role") == "function":
+                pending = pending_calls.get(get("name", ""))
+                if pending:
+                    complete_executions.append((pending.popleft(), response))
 
+        self._response_cursor = max(self._response_cursor, end)
         return complete_executions
 
-    def _get_tool_signature(self, tool_call, result):
-        """Generate unique signature for a tool execution to avoid duplicates."""
-        func_call = tool_call["function_call"]
-        tool_name = func_call.get("name", "")
-        arguments = func_call.get("arguments", "")
-        result_preview = (
-            result["content"][:50] if result and result.get("content") else ""
-        )
-
-        # For todo tools, include a hash of the result to make each call unique
-        # since each todo update should be displayed in the UI
-        if tool_name in ["todo_write", "todo_read"]:
-            signature_str = f"{tool_name}|{result_preview}"
-        else:
-            # For other tools, use full signature for deduplication
-            signature_str = f"{tool_name}|{arguments}|{result_preview}"
-
-        import hashlib
-
-        return hashlib.md5(signature_str.encode()).hexdigest()
-
     def _send_tool_execution(self, tool_call, result):
         """Send a single complete tool execution message."""
         func_call = tool_call["function_call"]
@@ -307,8 +328,6 @@ class SniffAgent:
         arguments = func_call["arguments"]
 
         try:
-            import json
-
             args_dict = (
                 json.loads(arguments) if isinstance(arguments, str) else arguments
             )
@@ -343,13 +362,9 @@ class SniffAgent:
 
         # Todo state is already included in the tool result - no need for separate message
 
-    # Removed: _handle_complete_tool_call (legacy)
-
     def _gen_msg_id(self) -> str:
         """Generate unique message ID."""
-        import uuid
-
-        return str(uuid.uuid4())[:8]
+        return f"{self._msg_id_prefix}{next(self._msg_id_counter):04x}"
 
     def stop(self):
         """Stop the agent and cleanup."""
@@ -1,34 +1,59 @@
 """Simple message receiver using queue.Queue internally."""
 
 import queue
+from dataclasses import replace
 from typing import Iterator
 
-from .types import AgentMessage
+from .types import AgentMessage, StreamChunkMessage
+
+
+# Queued by close() to wake up and end iteration
+_CLOSED = object()
 
 
 class MessageReceiver:
-    """Receives messages using Python's built-in queue.Queue."""
+    """Receives messages using Python's built-in queue.Queue.
+
+    Iterating the receiver is the only way to consume messages, so the
+    sentinel queued by close() never reaches a caller. Stream chunks that
+    piled up while the consumer was busy are merged into one message, so a
+    slow consumer catches up in one step instead of once per token; nothing
+    is ever held back waiting for more.
+    """
 
     def __init__(self):
         """Initialize the message receiver."""
         self._queue = queue.Queue()
 
+    def __iter__(self) -> Iterator[AgentMessage]:
+        """Yield messages as they arrive, blocking until close() is called."""
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        message = get()
+        while message is not _CLOSED:
+            following = None
+            if isinstance(message, StreamChunkMessage):
+                parts = [message.content]
+                try:
+                    following = get_nowait()
+                    while isinstance(following, StreamChunkMessage):
+                        parts.append(following.content)
+                        following = get_nowait()
+                except queue.Empty:
+                    following = None
+                if len(parts) > 1:
+                    message = replace(message, content="".join(parts))
+
+            yield message
+            message = get() if following is None else following
+
+        # Leave it queued so any later iteration ends too
+        self._queue.put(_CLOSED)
+
     def receive_message(self, message: AgentMessage) -> None:
         """Receive a message for processing."""
         self._queue.put(message)
 
-    def get_message(self, timeout: float = None) -> AgentMessage:
-        """Get a message from the queue. Blocks until available or timeout."""
-        return self._queue.get(timeout=timeout)
-
-    def get_message_nowait(self) -> AgentMessage:
-        """Get a message without blocking. Raises queue.Empty if none available."""
-        return self._queue.get_nowait()
-
-    def empty(self) -> bool:
-        """Check if queue is empty."""
-        return self._queue.empty()
-
-    def qsize(self) -> int:
-        """Get approximate queue size."""
-        return self._queue.qsize()
+    def close(self) -> None:
+        """Signal that no more messages will arrive, ending iteration."""
+        self._queue.put(_CLOSED)
@@ -58,13 +58,20 @@ class StreamStartMessage(AgentMessage):
 
     content_type: str = "text"  # "text", "analysis", "report"
     metadata: Optional[Dict[str, Any]] = None
+    initial_content: str = ""  # First chunk, carried here to save a message
 
     message_type: ClassVar[MessageType] = MessageType.STREAM_START
 
 
 @dataclass
 class StreamChunkMessage(AgentMessage):
-    """A chunk of content in a streaming message."""
+    """A chunk of content in a streaming message.
+
+    chunk_index numbers the chunks as the agent produced them. Iterating a
+    MessageReceiver merges chunks that queued up behind each other, and the
+    merged message keeps the first one's index, so indices seen by a consumer
+    can skip.
+    """
 
     content: str
     chunk_index: int = 0
@@ -75,7 +82,12 @@ class StreamChunkMessage(AgentMessage):
 
 @dataclass
 class StreamEndMessage(AgentMessage):
-    """Indicates the current streaming message is complete."""
+    """Indicates the current streaming message is complete.
+
+    total_chunks counts the chunks the agent produced, including any initial
+    content carried by StreamStartMessage, not the messages a consumer
+    received after merging.
+    """
 
     total_chunks: int = 0
     final_content: Optional[str] = None
@@ -7,6 +7,9 @@ from docker.errors import DockerException, ImageNotFound
 
 
 class Sandbox:
+    # Exit status the workspace script uses when the mount holds no zip file
+    _NO_ZIP_EXIT_CODE = 90
+
     def __init__(self, zipped_codebase_path: str):
         self.zipped_codebase_path = zipped_codebase_path
         self.client = docker.from_env()
@@ -35,46 +38,17 @@ class Sandbox:
                 network_mode="none",
             )
 
-            # Check if /original_workspace is a directory or a file
-            exit_code, _ = self.container.exec_run(
-                ["sh", "-c", "test -d /original_workspace"]
-            )
-
-            # If /original_workspace is NOT a directory, assume it's the zip file itself
-            if exit_code != 0:
-                zip_file_path = "/original_workspace"
-            else:
-                # Otherwise, look for zip files in the directory
-                exit_code, output = self.container.exec_run(
-                    ["sh", "-c", "find /original_workspace -name '*.zip' -type f"]
-                )
-
-                if exit_code != 0 or not output.decode().strip():
-                    raise Exception("No zip file found in mounted directory")
-
-                zip_file_path = output.decode().strip().split("\n")[0]
-
-            # Unzip the codebase with timeout if available
+            # Locate the zip, unpack it and copy it into /workspace in a single
+            # exec; each exec_run is a full docker API round trip
             exit_code, output = self.container.exec_run(
-                [
-                    "sh",
-                    "-c",
-                    f"if command -v timeout >/dev/null 2>&1; then timeout {self.UNZIP_TIMEOUT_SEC} unzip -o {zip_file_path} -d /tmp; else unzip -o {zip_file_path} -d /tmp; fi",
-                ]
+                ["sh", "-c", self._prepare_workspace_script()]
             )
 
+            if exit_code == self._NO_ZIP_EXIT_CODE:
+                raise Exception("No zip file found in mounted directory")
             if exit_code != 0:
                 raise Exception(f"Unzip failed: {output.decode()}")
 
-            # Move contents from the extracted subdirectory to workspace root, preserving structure
-            self.container.exec_run(
-                [
-                    "sh",
-                    "-c",
-                    "cd /tmp && if [ -d */ ]; then cd */ && cp -r . /workspace/; else cp -r . /workspace/; fi",
-                ]
-            )
-
             # Expose container ID to BashTool via environment variable
             os.environ["SNIFF_CONTAINER_ID"] = self.container_name
             return self.container_name
@@ -83,6 +57,26 @@ class Sandbox:
             self._cleanup_container()
             raise
 
+    def _prepare_workspace_script(self) -> str:
+        """Build the shell script that unpacks the mounted codebase into /workspace."""
+        timeout = self.UNZIP_TIMEOUT_SEC
+        return (
+            # If /original_workspace is NOT a directory, assume it's the zip file
+            # itself; otherwise, use the first zip file in the directory
+            "if [ -d /original_workspace ]; then "
+            "zip_file=$(find /original_workspace -name '*.zip' -type f | head -n 1); "
+            f'[ -n "$zip_file" ] || exit {self._NO_ZIP_EXIT_CODE}; '
+            "else zip_file=/original_workspace; fi; "
+            # Unzip the codebase with timeout if available
+            "if command -v timeout >/dev/null 2>&1; then "
+            f'timeout {timeout} unzip -o "$zip_file" -d /tmp || exit $?; '
+            'else unzip -o "$zip_file" -d /tmp || exit $?; fi; '
+            # Move contents from the extracted subdirectory to workspace root,
+            # preserving structure
+            "cd /tmp && if [ -d */ ]; then cd */ && cp -r . /workspace/; "
+            "else cp -r . /workspace/; fi; exit 0"
+        )
+
     def stop(self) -> None:
         """Stop the Docker container, and clean up the environment."""
         self._cleanup_container()
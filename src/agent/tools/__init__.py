@@ -1,7 +1,14 @@
+import functools
 import os
 import subprocess
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+import docker
+
+from agent.utils.param_parser import ParameterParser
+
 # Re-export unified path utilities
 from .path_utils import normalize_path, to_workspace_relative
 
@@ -13,11 +20,103 @@ __all__ = [
     "load_tool_description",
     "load_prompt",
     "parse_tool_params",
+    "cached_tool_call",
 ]
 
 # Configurable timeout for container commands
 RUN_IN_CONTAINER_TIMEOUT_SEC = 60
 
+# Docker client and container handle shared across tool calls, so each call
+# doesn't pay for client setup and a container lookup round trip
+_docker_client = None
+_cached_container = (None, None)  # (container_id, container)
+# Tools run commands from worker threads too, so the handles above are only
+# read and replaced under this lock
+_docker_lock = threading.Lock()
+
+
+class ToolRunCache:
+    """Bounded LRU of tool outputs keyed by (container_id, tool_name, params).
+
+    The workspace inside a sandbox never changes while the container is alive,
+    so a read-only tool called twice with the same params yields the same output.
+    Only one container is served at a time: entries are dropped when a key for
+    a different container arrives, so a stopped container's outputs go as soon
+    as its successor makes a call. Container names are unique per sandbox, so
+    stale entries can never be hit in the meantime. The cache is bounded both
+    by entry count and by the total length of the stored outputs.
+    """
+
+    def __init__(self, maxsize: int = 128, max_chars: int = 4_000_000):
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self._entries = OrderedDict()
+        self._chars = 0
+        self._container_id = None
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached output for key, or None."""
+        with self._lock:
+            output = self._entries.get(key)
+            if output is not None:
+                self._entries.move_to_end(key)
+            return output
+
+    def put(self, key, output: str) -> None:
+        """Store output for key, evicting least recently used entries."""
+        if len(output) > self.max_chars:
+            return
+
+        with self._lock:
+            if key[0] != self._container_id:
+                self._clear()
+                self._container_id = key[0]
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._chars -= len(previous)
+            self._entries[key] = output
+            self._chars += len(output)
+
+            while len(self._entries) > self.maxsize or self._chars > self.max_chars:
+                _key, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached output."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._chars = 0
+        self._container_id = None
+
+
+_tool_run_cache = ToolRunCache()
+
+
+def cached_tool_call(call):
+    """Cache a read-only tool's call() output for the current sandbox container."""
+
+    @functools.wraps(call)
+    def wrapper(self, params: str, **kwargs) -> str:
+        container_id = os.environ.get("SNIFF_CONTAINER_ID")
+        if not container_id:
+            return call(self, params, **kwargs)
+
+        key = (container_id, self.name, params)
+        output = _tool_run_cache.get(key)
+        if output is None:
+            output = call(self, params, **kwargs)
+            # Errors may be transient (e.g. exec failures), so don't pin them
+            if not output.startswith("Error:"):
+                _tool_run_cache.put(key, output)
+        return output
+
+    return wrapper
+
 
 def load_tool_description(tool_name: str) -> str:
     """Load tool description from corresponding .txt file"""
@@ -28,11 +127,24 @@ def load_tool_description(tool_name: str) -> str:
         return ""
 
 
+_PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+
+# Loaded prompts keyed by name, as (mtime_ns, text); a stat is much cheaper than
+# re-reading the file, and still picks up edits to a prompt
+_prompt_cache = {}
+
+
 def load_prompt(prompt_name: str) -> str:
-    """Load prompt from corresponding .txt file in prompts directory"""
-    prompts_dir = Path(__file__).parent.parent / "prompts"
-    prompt_path = prompts_dir / f"{prompt_name}.txt"
-    return prompt_path.read_text().strip()
+    """Load prompt from corresponding .txt file in prompts directory (cached until the file changes)"""
+    prompt_path = _PROMPTS_DIR / f"{prompt_name}.txt"
+    mtime_ns = os.stat(prompt_path).st_mtime_ns
+    cached = _prompt_cache.get(prompt_name)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    text = prompt_path.read_text().strip()
+    _prompt_cache[prompt_name] = (mtime_ns, text)
+    return text
 
 
 def run_in_container(command: str) -> str:
@@ -59,12 +171,37 @@ def run_in_container(command: str) -> str:
     return "Error: All execution methods failed"
 
 
+def _get_container(container_id: str):
+    """Return the container handle for container_id, reusing the cached one."""
+    global _docker_client, _cached_container
+
+    with _docker_lock:
+        cached_id, container = _cached_container
+        if cached_id == container_id:
+            return container
+
+        if _docker_client is None:
+            _docker_client = docker.from_env()
+        container = _docker_client.containers.get(container_id)
+        _cached_container = (container_id, container)
+        return container
+
+
 def _try_docker_sdk(container_id: str, command: str, formatter) -> str:
     """Execute via Docker SDK."""
-    import docker
+    global _cached_container
 
-    client = docker.from_env()
-    result = client.containers.get(container_id).exec_run(cmd=["sh", "-c", command])
+    container = None
+    try:
+        container = _get_container(container_id)
+        result = container.exec_run(cmd=["sh", "-c", command])
+    except Exception:
+        # Drop a stale handle so the next call looks the container up again,
+        # unless another thread has already replaced it
+        with _docker_lock:
+            if container is not None and _cached_container[1] is container:
+                _cached_container = (None, None)
+        raise
     output = (
         result.output.decode("utf-8", errors="replace")
         if isinstance(result.output, (bytes, bytearray))
@@ -96,8 +233,6 @@ def parse_tool_params(
     default_path: str = ".",
 ):
     """Parse and normalize common tool parameters."""
-    from agent.utils.param_parser import ParameterParser
-
     parsed_params = ParameterParser.parse_params(params)
     original_path = (
         ParameterParser.get_required_param(parsed_params, path_param)
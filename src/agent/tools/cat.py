@@ -1,10 +1,12 @@
 import difflib
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from qwen_agent.tools.base import BaseTool, register_tool
 
 from agent.tools import (
+    cached_tool_call,
     load_tool_description,
     parse_tool_params,
     run_in_container,
@@ -15,6 +17,9 @@ from agent.utils.param_parser import ParameterParser
 DEFAULT_READ_LIMIT = 2000
 MAX_LINE_LENGTH = 2000
 
+# Independent container round trips are issued side by side to overlap latency
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cat-tool")
+
 
 @register_tool("cat")
 class CatTool(BaseTool):
@@ -40,6 +45,7 @@ class CatTool(BaseTool):
         },
     ]
 
+    @cached_tool_call
     def call(self, params: str, **kwargs) -> str:
         try:
             parsed_params, file_path, original_path = parse_tool_params(
@@ -51,14 +57,17 @@ class CatTool(BaseTool):
                 parsed_params, "limit", DEFAULT_READ_LIMIT
             )
 
-            # Binary detection (heuristic via null bytes; fallback to mimetypes)
-            if self._is_binary_file(file_path):
-                return f"Error: Cannot read binary file: {original_path}\nThis appears to be a binary file."
+            # Binary detection (heuristic via null bytes; fallback to mimetypes),
+            # probed concurrently with the existence/size check below
+            binary_probe = _EXECUTOR.submit(self._is_binary_file, file_path)
 
             # Check existence and size in a single call for efficiency
             check_cmd = f'stat -c "%F %s" "{file_path}" 2>/dev/null || echo "not_found"'
             stat_result = run_in_container(check_cmd)
 
+            if binary_probe.result():
+                return f"Error: Cannot read binary file: {original_path}\nThis appears to be a binary file."
+
             if not stat_result or "not_found" in stat_result:
                 # Try to suggest similar files
                 suggestions = self._get_file_suggestions(file_path, original_path)
@@ -87,6 +96,10 @@ class CatTool(BaseTool):
                 end_line = offset + limit
                 cat_cmd = f'tail -n +{start_line} "{file_path}" | head -{limit} | nl -v {start_line}'
 
+            # Count total lines alongside the read so we know if there is more
+            total_lines_cmd = f'wc -l < "{file_path}"'
+            total_future = _EXECUTOR.submit(run_in_container, total_lines_cmd)
+
             result = run_in_container(cat_cmd)
 
             if result.startswith("Error:"):
@@ -115,8 +128,7 @@ class CatTool(BaseTool):
                 return "File is empty."
 
             # Check if there are more lines beyond what we read
-            total_lines_cmd = f'wc -l < "{file_path}"'
-            total_result = run_in_container(total_lines_cmd)
+            total_result = total_future.result()
 
             output = "\n".join(formatted_lines)
 
@@ -1,8 +1,7 @@
-import json
-
 from qwen_agent.tools.base import BaseTool, register_tool
 
 from agent.tools import (
+    cached_tool_call,
     load_tool_description,
     parse_tool_params,
 )
@@ -11,8 +10,15 @@ from agent.tools.rg_utils import (
     rg_list_files,
     to_workspace_relative_lines,
 )
+from agent.utils.json_block import json_block
 from agent.utils.param_parser import ParameterParser
 
+# Structured block for an empty match, serialized once
+_NO_FILES_JSON = json_block({"files": []})
+
+# Patterns that match everything, so no include glob is needed
+_MATCH_ALL_PATTERNS = frozenset({"*", "**", "**/*"})
+
 
 @register_tool("glob")
 class GlobTool(BaseTool):
@@ -33,21 +39,21 @@ class GlobTool(BaseTool):
         },
     ]
 
+    @cached_tool_call
     def call(self, params: str, **kwargs) -> str:
         try:
             parsed_params, search_path, original_path = parse_tool_params(params)
             pattern = ParameterParser.get_required_param(parsed_params, "pattern")
 
             # List files via ripgrep helper
-            include_globs = None if pattern in ["*", "**", "**/*"] else [pattern]
+            include_globs = None if pattern in _MATCH_ALL_PATTERNS else [pattern]
             lines = rg_list_files(
                 search_path, include_globs=include_globs, limit=self.LIMIT
             )
 
             if not lines:
                 text = f"No files found matching pattern '{pattern}' in {original_path}"
-                payload = {"files": []}
-                return f"{text}\n\n<!--JSON-->" + json.dumps(payload) + "<!--/JSON-->"
+                return f"{text}\n\n{_NO_FILES_JSON}"
 
             # Convert absolute paths back to relative for display
             display_lines = to_workspace_relative_lines(lines)
@@ -65,7 +71,7 @@ class GlobTool(BaseTool):
 
             # Append structured JSON block for UI consumers
             payload = {"files": display_lines}
-            return f"{text}\n\n<!--JSON-->" + json.dumps(payload) + "<!--/JSON-->"
+            return f"{text}\n\n{json_block(payload)}"
 
         except Exception as e:
             return f"Error: {str(e)}"
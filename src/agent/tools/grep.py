@@ -1,17 +1,21 @@
-import json
 import shlex
 from typing import List, Optional, Union
 
 from qwen_agent.tools.base import BaseTool, register_tool
 
 from agent.tools import (
+    cached_tool_call,
     load_tool_description,
     parse_tool_params,
     run_in_container,
     to_workspace_relative,
 )
+from agent.utils.json_block import json_block
 from agent.utils.param_parser import ParameterParser
 
+# Structured block for an empty search, serialized once
+_NO_MATCHES_JSON = json_block({"matches": []})
+
 
 @register_tool("grep")
 class GrepTool(BaseTool):
@@ -37,6 +41,7 @@ class GrepTool(BaseTool):
         },
     ]
 
+    @cached_tool_call
     def call(self, params: str, **kwargs) -> str:
         try:
             parsed_params, directory, original_directory = parse_tool_params(
@@ -88,8 +93,7 @@ class GrepTool(BaseTool):
         # Convert absolute paths back to relative for display
         if not result or not result.strip():
             text = f"No files found containing pattern: {pattern}"
-            payload = {"matches": []}
-            return f"{text}\n\n<!--JSON-->" + json.dumps(payload) + "<!--/JSON-->"
+            return f"{text}\n\n{_NO_MATCHES_JSON}"
 
         lines = result.strip().split("\n")
         display_lines = [to_workspace_relative(line) for line in lines]
@@ -112,4 +116,4 @@ class GrepTool(BaseTool):
 
         text = "\n".join(display_lines)
         payload = {"matches": matches}
-        return f"{text}\n\n<!--JSON-->" + json.dumps(payload) + "<!--/JSON-->"
+        return f"{text}\n\n{json_block(payload)}"
@@ -1,15 +1,16 @@
-import json
 import shlex
 from pathlib import Path
 
 from qwen_agent.tools.base import BaseTool, register_tool
 
 from agent.tools import (
+    cached_tool_call,
     load_tool_description,
     parse_tool_params,
     run_in_container,
 )
 from agent.tools.rg_utils import rg_count_files, rg_list_files
+from agent.utils.json_block import json_block
 from agent.utils.param_parser import ParameterParser
 
 LIMIT = 100
@@ -33,6 +34,7 @@ class LsTool(BaseTool):
         },
     ]
 
+    @cached_tool_call
     def call(self, params: str, **kwargs) -> str:
         try:
             # Handle empty params case
@@ -96,7 +98,7 @@ class LsTool(BaseTool):
 
             text = "\n".join(entries)
             payload = {"entries": entries}
-            return f"{text}\n\n<!--JSON-->" + json.dumps(payload) + "<!--/JSON-->"
+            return f"{text}\n\n{json_block(payload)}"
 
         except Exception as e:
             return f"Error: {str(e)}"
@@ -5,6 +5,9 @@ from qwen_agent.tools.base import BaseTool, register_tool
 from agent.tools import load_tool_description
 from agent.utils.todo_manager import get_todo_manager, todos_to_json_block
 
+# Result for an empty list never changes, so build it once
+_NO_TODOS_RESULT = f"No todos currently exist.\n\n{todos_to_json_block([])}"
+
 
 @register_tool("todo_read")
 class TodoReadTool(BaseTool):
@@ -24,7 +27,7 @@ class TodoReadTool(BaseTool):
 
         # Return empty list if no todos exist
         if not todos:
-            return f"No todos currently exist.\n\n{todos_to_json_block([])}"
+            return _NO_TODOS_RESULT
 
         formatted = todo_manager.format_todos()
         return f"{formatted}\n\n{todos_to_json_block(todos)}"
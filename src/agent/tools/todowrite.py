@@ -3,7 +3,7 @@ import json
 from qwen_agent.tools.base import BaseTool, register_tool
 
 from agent.tools import load_tool_description
-from agent.utils.param_parser import ParameterParser
+from agent.utils.param_parser import ParameterParser, load_json
 from agent.utils.todo_manager import get_todo_manager, todos_to_json_block
 
 
@@ -27,9 +27,7 @@ class TodoWriteTool(BaseTool):
             # Parse todos list
             if isinstance(todos_param, str):
                 try:
-                    import json5
-
-                    todos_list = json5.loads(todos_param)
+                    todos_list = load_json(todos_param)
                 except Exception:
                     return "Error: todos must be a valid JSON array"
             else:
@@ -0,0 +1,11 @@
+"""Machine-readable JSON blocks appended to tool results for the TUI."""
+
+import json
+
+# Compact encoder shared by every tool's machine-readable result block
+_JSON_BLOCK_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def json_block(payload) -> str:
+    """Wrap payload in the <!--JSON-->...<!--/JSON--> block the TUI widgets parse."""
+    return f"<!--JSON-->{_JSON_BLOCK_ENCODER.encode(payload)}<!--/JSON-->"
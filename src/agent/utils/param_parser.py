@@ -1,4 +1,6 @@
+import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import json5
@@ -6,6 +8,24 @@ import json5
 logger = logging.getLogger(__name__)
 
 
+def load_json(text: str) -> Any:
+    """Parse JSON5 text, trying the much faster strict JSON parser first.
+
+    Models almost always emit strict JSON, which the C-accelerated json module
+    handles directly; json5 is only needed for the lenient extras.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json5.loads(text)
+
+
+@lru_cache(maxsize=256)
+def _load_params(params: str) -> Any:
+    """Parse a raw parameter string, memoized since the model often repeats calls."""
+    return load_json(params)
+
+
 class ParameterParser:
     """Shared utility for parsing tool parameters."""
 
@@ -30,8 +50,11 @@ class ParameterParser:
             return {}
 
         try:
-            parsed_params = json5.loads(params)
+            parsed_params = _load_params(params)
             logger.debug(f"Successfully parsed JSON5: {parsed_params}")
+            # Hand out a copy so callers can't mutate the cached entry
+            if isinstance(parsed_params, dict):
+                return dict(parsed_params)
             return parsed_params
         except Exception as parse_error:
             raise ValueError(f"Invalid parameters format: {parse_error}")
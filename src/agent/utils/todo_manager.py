@@ -3,6 +3,11 @@ import uuid
 from dataclasses import dataclass
 from typing import List
 
+from agent.utils.json_block import json_block
+
+# Names of the tools that read and write the todo list
+TODO_TOOLS = frozenset({"todo_write", "todo_read"})
+
 
 @dataclass
 class TodoItem:
@@ -173,7 +178,7 @@ def todos_to_json_block(todos: List[TodoItem]) -> str:
             for t in todos
         ]
     }
-    return f"<!--JSON-->{json.dumps(payload)}<!--/JSON-->"
+    return json_block(payload)
 
 
 def parse_todos_json_block(result: str) -> list[dict]:
@@ -21,8 +21,6 @@ load_dotenv()
 
 def load_css_path_list() -> list[str]:
     """Load a list of CSS paths"""
-    from pathlib import Path
-
     tui_path = get_path("tui")
 
     # Use rglob to recursively find all .tcss files
@@ -76,8 +74,6 @@ def main(
     # Configure logging if debug flag is set
     if debug:
         # Create logs directory if it doesn't exist
-        import os
-
         os.makedirs("logs", exist_ok=True)
 
         # Clear any existing log file
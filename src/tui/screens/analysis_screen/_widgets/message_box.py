@@ -7,6 +7,7 @@ from typing import Literal
 from rich.console import RenderableType
 from rich.markdown import Markdown
 from rich.syntax import Syntax
+from rich.text import Text
 from textual.reactive import reactive
 from textual.widget import Widget
 from tui.utils.json_detector import json_detector
@@ -45,7 +46,6 @@ class MessageBox(Widget, can_focus=True):
         
         # Analysis as markdown - return empty Text if no content to avoid showing empty widget
         if not content_to_render.strip():
-            from rich.text import Text
             return Text("")  # Return empty text instead of empty string
         return Markdown(content_to_render, code_theme="monokai")
     
@@ -1,8 +1,11 @@
 import json
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Optional, Union
 
 from textual.widgets import Markdown
 
+from tui.utils.args import get_arg
+
 
 def make_markdown(
     content: str, classes: str = "search-markdown", bullets: list[str] | None = None
@@ -44,11 +47,6 @@ def subtitle_from_args(
 
     If quote=True and a value is present, wrap it in double quotes.
     """
-    try:
-        from tui.utils.args import get_arg
-    except Exception:
-        return default
-
     value = get_arg(arguments, keys, default)
     if value is None or value == "":
         return default
@@ -56,9 +54,17 @@ def subtitle_from_args(
 
 
 def parse_json_block(result: Optional[str]) -> Optional[Dict[str, Any]]:
-    """Parse an embedded JSON block delimited by <!--JSON-->...<!--/JSON-->."""
+    """Parse an embedded JSON block delimited by <!--JSON-->...<!--/JSON-->.
+
+    Results are memoized on the tool output, so treat the payload as read-only.
+    """
     if not result:
         return None
+    return _parse_json_block(result)
+
+
+@lru_cache(maxsize=64)
+def _parse_json_block(result: str) -> Optional[Dict[str, Any]]:
     try:
         start_token = "<!--JSON-->"
         end_token = "<!--/JSON-->"
@@ -1,5 +1,8 @@
 """Ls tool message widget"""
 
+from collections import defaultdict
+from functools import cached_property
+
 from textual.app import ComposeResult
 from textual.widgets import Static
 
@@ -15,10 +18,6 @@ class LsToolMessage(BaseToolMessage):
 
     def __init__(self, tool_message: ToolExecutionMessage, directory_output=None):
         super().__init__(tool_message)
-        if tool_message.result and tool_message.success:
-            self.entries = self._parse_ls_output(tool_message.result)
-        else:
-            self.entries = []
 
     def get_title(self) -> str:
         return "☰ Ls"
@@ -31,15 +30,21 @@ class LsToolMessage(BaseToolMessage):
             default=" .",
         )
 
-    def create_body(self) -> Static:
-        # Group entries by directory and render a nested Markdown list
+    @cached_property
+    def entries(self) -> list[str]:
+        """Listing entries, parsed once on first use."""
         # Prefer JSON block if available
         payload = parse_json_block(self.tool_message.result)
         if payload and isinstance(payload, dict) and "entries" in payload:
-            entries = payload.get("entries", [])
-            groups = self._group_entries_by_dir(entries)
-        else:
-            groups = self._group_entries_by_dir(self.entries)
+            return payload.get("entries", [])
+        if self.tool_message.result and self.tool_message.success:
+            # Only fall back to scanning the text listing when there is no JSON
+            return self._parse_ls_output(self.tool_message.result)
+        return []
+
+    def create_body(self) -> Static:
+        # Group entries by directory and render a nested Markdown list
+        groups = self._group_entries_by_dir(self.entries)
         md_lines = []
         if groups:
             for directory, files in groups.items():
@@ -57,13 +62,7 @@ class LsToolMessage(BaseToolMessage):
         return path if path else "."
 
     def _parse_ls_output(self, ls_output: str) -> list[str]:
-        entries: list[str] = []
-        for line in ls_output.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            entries.append(line)
-        return entries
+        return [entry for line in ls_output.splitlines() if (entry := line.strip())]
 
     def _markdown(self, content: str):
         md = make_markdown(content, classes="search-markdown")
@@ -81,8 +80,6 @@ class LsToolMessage(BaseToolMessage):
         - Files are grouped by their parent directory (or './' for root).
         - Directory keys include trailing '/' (except root which is './').
         """
-        from collections import defaultdict
-
         dir_to_files: dict[str, list[str]] = defaultdict(list)
 
         # Ensure we include directories observed in the listing
@@ -93,10 +90,10 @@ class LsToolMessage(BaseToolMessage):
                 observed_dirs.add(entry)
                 continue
             # File: group under parent directory
-            if "/" in entry:
-                parent = entry.rsplit("/", 1)[0] + "/"
+            parent, slash, file_name = entry.rpartition("/")
+            if slash:
+                parent += "/"
                 observed_dirs.add(parent)
-                file_name = entry.rsplit("/", 1)[1]
                 dir_to_files[parent].append(file_name)
             else:
                 # Root-level file
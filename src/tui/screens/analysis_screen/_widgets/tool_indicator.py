@@ -1,11 +1,65 @@
 """Minimal tool call indicator widget."""
 
 import json
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from rich.text import Text
 from textual.widget import Widget
 
+from agent.utils.todo_manager import TODO_TOOLS
+
+# Symbol mapping based on tool_plans.md
+# Using U+2064 invisible plus (forces text) as a workaround
+_TOOL_SYMBOLS = {
+    "cat": "⚯",  # Eye with invisible plus forces text rendering
+    "glob": "⌕\ufe0e",
+    "grep": "⌕\ufe0e",
+    "ls": "☰",  # Directory path
+    "todo_read": "⚯",  # Eye with invisible plus
+    "todo_write": "✎\ufe0e",
+}
+
+
+@lru_cache(maxsize=1024)
+def _display_text_from_json(tool_name: str, arguments: str) -> str:
+    """Display text for JSON string arguments, memoized per (tool, arguments)."""
+    try:
+        args = json.loads(arguments)
+    except Exception:
+        args = {}
+    return _build_display_text(tool_name, args if isinstance(args, dict) else {})
+
+
+def _build_display_text(tool_name: str, args: Dict[str, Any]) -> str:
+    """Create descriptive text based on tool name and arguments."""
+    symbol = _TOOL_SYMBOLS.get(tool_name, "")
+
+    if tool_name == "cat":
+        file_path = args.get("filePath", "")
+        return f"{symbol} cat {file_path}" if file_path else f"{symbol} cat"
+    elif tool_name == "ls":
+        directory = args.get("path", args.get("directory", "."))
+        return f"{symbol} ls {directory}"
+    elif tool_name == "glob":
+        pattern = args.get("pattern", "")
+        return f"{symbol} glob '{pattern}'" if pattern else f"{symbol} glob"
+    elif tool_name == "grep":
+        pattern = args.get("pattern", "")
+        return f"{symbol} grep '{pattern}'" if pattern else f"{symbol} grep"
+    elif tool_name == "run_in_container":
+        command = args.get("command", "")
+        if len(command) > 30:
+            command = command[:27] + "..."
+        return f"run '{command}'" if command else "run"
+    elif tool_name == "todo_write":
+        return f"{symbol} writing todos"
+    elif tool_name == "todo_read":
+        return f"{symbol} reading todos"
+
+    # Fallback to tool name with symbol
+    return f"{symbol} {tool_name}" if symbol else tool_name
+
 
 class ToolIndicator(Widget):
     """A minimal widget to show tool calls without taking up much space."""
@@ -33,55 +87,11 @@ class ToolIndicator(Widget):
 
     def _create_display_text(self) -> str:
         """Create a user-friendly display text for the tool call."""
-
-        # Symbol mapping based on tool_plans.md
-        # Using U+2064 invisible plus (forces text) as a workaround
-        tool_symbols = {
-            "cat": "⚯",  # Eye with invisible plus forces text rendering
-            "glob": "⌕\ufe0e",
-            "grep": "⌕\ufe0e",
-            "ls": "☰",  # Directory path
-            "todo_read": "⚯",  # Eye with invisible plus
-            "todo_write": "✎\ufe0e",
-        }
-
-        symbol = tool_symbols.get(self.tool_name, "")
-
-        # Arguments are expected to be a dict; try to parse if provided as JSON string
-        args: Dict[str, Any] = {}
+        # Arguments are expected to be a dict; JSON strings go through the cache
         if isinstance(self.arguments, str):
-            try:
-                args = json.loads(self.arguments)
-            except Exception:
-                args = {}
-        elif isinstance(self.arguments, dict):
-            args = self.arguments
-
-        # Create descriptive text based on tool name and arguments
-        if self.tool_name == "cat":
-            file_path = args.get("filePath", "")
-            return f"{symbol} cat {file_path}" if file_path else f"{symbol} cat"
-        elif self.tool_name == "ls":
-            directory = args.get("path", args.get("directory", "."))
-            return f"{symbol} ls {directory}"
-        elif self.tool_name == "glob":
-            pattern = args.get("pattern", "")
-            return f"{symbol} glob '{pattern}'" if pattern else f"{symbol} glob"
-        elif self.tool_name == "grep":
-            pattern = args.get("pattern", "")
-            return f"{symbol} grep '{pattern}'" if pattern else f"{symbol} grep"
-        elif self.tool_name == "run_in_container":
-            command = args.get("command", "")
-            if len(command) > 30:
-                command = command[:27] + "..."
-            return f"run '{command}'" if command else "run"
-        elif self.tool_name == "todo_write":
-            return f"{symbol} writing todos"
-        elif self.tool_name == "todo_read":
-            return f"{symbol} reading todos"
-
-        # Fallback to tool name with symbol
-        return f"{symbol} {self.tool_name}" if symbol else self.tool_name
+            return _display_text_from_json(self.tool_name, self.arguments)
+        args = self.arguments if isinstance(self.arguments, dict) else {}
+        return _build_display_text(self.tool_name, args)
 
     def render(self) -> Text:
         """Render a compact tool indicator."""
@@ -89,7 +99,7 @@ class ToolIndicator(Widget):
             text = Text(self.display_text)
 
             # If this is a todo tool and we have todo data, append it
-            if self.tool_name in ["todo_write", "todo_read"] and self.todo_data:
+            if self.tool_name in TODO_TOOLS and self.todo_data:
                 for i, todo in enumerate(self.todo_data):
                     # First todo gets the tree branch
                     if i == 0:
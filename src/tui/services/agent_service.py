@@ -1,6 +1,7 @@
 """Service layer for agent interaction, separating business logic from UI concerns."""
 
 import logging
+import threading
 from pathlib import Path
 from typing import Iterator, Optional
 
@@ -77,9 +78,7 @@ class AgentService:
             # Start agent
             with self._agent:
                 # Start analysis in background and yield messages as they come
-                import queue
-                import threading
-                import time
+                receiver = self._receiver
 
                 def run_agent_with_sandbox():
                     """Run agent analysis with proper sandbox startup."""
@@ -89,24 +88,16 @@ class AgentService:
                     except Exception as e:
                         logger.error(f"Agent analysis failed: {e}")
                         raise
+                    finally:
+                        # Ends the loop below once every message is consumed
+                        receiver.close()
 
                 analysis_thread = threading.Thread(target=run_agent_with_sandbox)
                 analysis_thread.start()
 
-                # Yield messages in real-time without busy-waiting
-                while True:
-                    try:
-                        # Block briefly for a message; timeout avoids deadlock at end
-                        message = self._receiver.get_message(timeout=0.5)
-                        yield message
-                    except queue.Empty:
-                        # No message within timeout; check for termination condition
-                        if not analysis_thread.is_alive() and self._receiver.empty():
-                            break
-                    except Exception as e:
-                        logger.error(f"Error receiving message: {e}")
-                        if not analysis_thread.is_alive() and self._receiver.empty():
-                            break
+                # Each message is handed over as soon as it is queued; no
+                # timeout wake-ups are needed to notice the end of the run
+                yield from receiver
 
                 # Wait for analysis to complete
                 analysis_thread.join()
@@ -18,7 +18,7 @@ from agent.messaging import (
     StreamStartMessage,
     ToolExecutionMessage,
 )
-from agent.utils.todo_manager import parse_todos_json_block
+from agent.utils.todo_manager import TODO_TOOLS, parse_todos_json_block
 from tui.screens.analysis_screen._widgets.center_screen import CenterWidget
 from tui.screens.analysis_screen._widgets.messages import TOOL_WIDGET_MAP
 from tui.screens.analysis_screen._widgets.messages.agent_message import AgentMessage
@@ -49,14 +49,11 @@ class MessageRenderer:
         self.current_agent_message: Optional[AgentMessage] = None
         self.report_placeholder: Optional[ToolIndicator] = None
         self.analysis_message_count = 0
-        self.analyzed_files: set = set()
         self._bug_report_widget = (
             None  # Reference to the bug report widget for updating
         )
-
-    def render_message(self, message: BaseAgentMessage) -> None:
-        """Render any agent message based on its type using dispatch mapping."""
-        dispatch_map = {
+        # Built once; render_message runs for every streamed chunk
+        self._dispatch_map = {
             MessageType.TOOL_EXECUTION: self.render_tool_execution,
             MessageType.STREAM_START: self.render_stream_start,
             MessageType.STREAM_CHUNK: self.render_stream_chunk,
@@ -65,7 +62,9 @@ class MessageRenderer:
             MessageType.BUG_REPORT: self.render_bug_report,
         }
 
-        handler = dispatch_map.get(message.message_type)
+    def render_message(self, message: BaseAgentMessage) -> None:
+        """Render any agent message based on its type using dispatch mapping."""
+        handler = self._dispatch_map.get(message.message_type)
         if handler:
             handler(message)  # type: ignore[arg-type]
         else:
@@ -76,7 +75,7 @@ class MessageRenderer:
         # Create appropriate widget based on tool type
         if message.tool_name in TOOL_WIDGET_MAP:
             widget = CenterWidget(TOOL_WIDGET_MAP[message.tool_name](message))
-        elif message.tool_name in ["todo_write", "todo_read"]:
+        elif message.tool_name in TODO_TOOLS:
             # Prefer machine-readable todos embedded in the result (always present from our tools)
             todos = parse_todos_json_block(message.result)
             if todos:
@@ -92,10 +91,6 @@ class MessageRenderer:
             self._render_tool_indicator(message)
             return
 
-        # Track analyzed files from cat operations
-        if message.tool_name == "cat" and message.success and message.result:
-            self._track_analyzed_file_from_tool(message)
-
         self._add_widget(widget)
 
     # Removed legacy text-based todo parsing; JSON block is always emitted by todo tools
@@ -109,7 +104,7 @@ class MessageRenderer:
             self.analysis_message_count += 1
 
         # Create stream AgentMessage wrapped in CenterWidget and keep references
-        agent_message = AgentMessage("")
+        agent_message = AgentMessage(message.initial_content)
         wrapper = CenterWidget(agent_message)
         wrapper.add_class("streaming")
         self.current_streaming_wrapper = wrapper
@@ -121,15 +116,17 @@ class MessageRenderer:
         if not self.current_agent_message:
             return
 
-        # Append content via public API
-        self.app.call_from_thread(
-            self.current_agent_message.append_chunk, message.content
-        )
+        agent_message = self.current_agent_message
 
-        # Keep the end in view with Textual's built-in deferral
-        self.app.call_from_thread(
-            lambda: self.messages_container.scroll_end(animate=False, immediate=False)
-        )
+        # One hop to the UI thread per chunk: call_from_thread blocks until the
+        # callback has run, so each extra call stalls the message loop
+        def _append_and_scroll() -> None:
+            # Append content via public API
+            agent_message.append_chunk(message.content)
+            # Keep the end in view with Textual's built-in deferral
+            self.messages_container.scroll_end(animate=False, immediate=False)
+
+        self.app.call_from_thread(_append_and_scroll)
 
     def render_stream_end(self, message: StreamEndMessage) -> None:
         """End rendering of a streaming message."""
@@ -217,33 +214,19 @@ class MessageRenderer:
 
     def _add_widget(self, widget: Widget) -> None:
         """Add a widget to the messages container."""
-        # Mount the widget
-        self.app.call_from_thread(self.messages_container.mount, widget)
 
-        # After mount, keep bottom in view using Textual's deferral
-        self.app.call_from_thread(
-            lambda: self.messages_container.scroll_end(animate=False, immediate=False)
-        )
+        async def _mount_and_scroll() -> None:
+            # Mount the widget
+            await self.messages_container.mount(widget)
+            # After mount, keep bottom in view using Textual's deferral
+            self.messages_container.scroll_end(animate=False, immediate=False)
+
+        self.app.call_from_thread(_mount_and_scroll)
 
     # Removed legacy tool indicator tracking
 
     # Grep parsing is centralized in the grep widget helper
 
-    def _track_analyzed_file_from_tool(self, message: ToolExecutionMessage) -> None:
-        """Extract and track file path from successful cat tool execution."""
-        try:
-            if message.tool_name == "cat" and message.arguments:
-                # Extract file path from arguments
-                if isinstance(message.arguments, dict):
-                    file_path = message.arguments.get(
-                        "filePath"
-                    ) or message.arguments.get("file")
-                    if file_path:
-                        self.analyzed_files.add(file_path)
-        except Exception:
-            # Don't let file tracking errors break the UI
-            pass
-
     def _render_tool_indicator(self, message: ToolExecutionMessage) -> None:
         """Render a simple ToolIndicator widget for a tool execution."""
         tool_indicator = ToolIndicator(
@@ -3,9 +3,24 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import io
+import json
+import re
+from json.decoder import WHITESPACE
 
 import ijson
 from ijson.common import JSONError, IncompleteJSONError
+from ijson.utils import sendable_list
+
+
+def _reject_constant(name: str):
+    # NaN/Infinity aren't JSON; reject them like ijson does
+    raise ValueError(f"Invalid JSON constant: {name}")
+
+
+_DECODER = json.JSONDecoder(parse_constant=_reject_constant)
+
+# Characters that can open a JSON document we care about
+_JSON_OPENING = re.compile(r"[{\[]")
 
 
 @dataclass
@@ -17,21 +32,91 @@ class ContentSplit:
     has_json: bool  # Whether JSON was found
     json_start_pos: int  # Position where JSON starts
     is_complete_json: bool  # Whether JSON appears complete
+    json_value: Any = None  # Decoded JSON, when it was decoded during the split
+
+
+@dataclass
+class _PartialJSON:
+    """Push parser left suspended on an unfinished JSON document."""
+
+    start: int  # Position of the document's opening in the content
+    parsed_len: int  # Length of the content fed to the parser so far
+    depth: int
+    parser: Any
+    events: Any
+    seen_value: bool = False  # Whether a non-structural event has been parsed
 
 
 class JSONDetector:
     """Detects and extracts JSON from streaming text content."""
 
+    def __init__(self):
+        # Streaming content grows by appending, so text before the first
+        # possible JSON opening never needs to be scanned again
+        self._last_content = ""
+        self._resume_pos = 0
+        # The unfinished document found last time, so the next call only has
+        # to parse what was appended to it
+        self._partial = None
+
     def split_content(self, content: str) -> ContentSplit:
         """Split content into text prefix and JSON parts.
 
         This scans for potential JSON openings and uses ijson to
-        confirm and locate the matching end.
+        confirm and locate the matching end. When content extends the
+        previous call's content, the scan resumes at the first opening
+        that was not ruled out last time, and an unfinished document found
+        last time is parsed only from where it left off.
         """
 
-        for idx, char in enumerate(content):
-            if char not in "{[":
-                continue
+        start = 0
+        partial = None
+        if self._last_content and content.startswith(self._last_content):
+            start = self._resume_pos
+            partial = self._partial
+        self._partial = None
+        self._last_content = content
+
+        resume_pos = None
+        # Let the regex engine skip plain text instead of stepping through it
+        # one character at a time in Python
+        for opening in _JSON_OPENING.finditer(content, start):
+            idx = opening.start()
+            if resume_pos is None:
+                resume_pos = idx
+
+            if partial is not None and idx == partial.start:
+                # The push parser holds back a trailing token that may still
+                # grow, but one value is enough to know this is JSON
+                if self._continue_partial(partial, content):
+                    self._partial = partial
+                    self._resume_pos = resume_pos
+                    return ContentSplit(
+                        prefix_text=content[:idx].strip(),
+                        json_content=content[idx:],
+                        has_json=True,
+                        json_start_pos=idx,
+                        is_complete_json=False,
+                    )
+                # Finished or broken; let the full probe below settle it
+
+            # Fast path: a complete document decodes in one C-level pass and
+            # tells us exactly where it ends; ijson is only needed to tell a
+            # partial document apart from plain text
+            try:
+                value, end_pos = _DECODER.raw_decode(content, idx)
+            except ValueError:
+                pass
+            else:
+                self._resume_pos = resume_pos
+                return ContentSplit(
+                    prefix_text=content[:idx].strip(),
+                    json_content=content[idx:end_pos],
+                    has_json=True,
+                    json_start_pos=idx,
+                    is_complete_json=True,
+                    json_value=value,
+                )
 
             stream = io.StringIO(content[idx:])
             parser = ijson.parse(stream)
@@ -44,6 +129,7 @@ class JSONDetector:
                     elif event in {"end_map", "end_array"}:
                         depth -= 1
                         if depth == 0:
+                            self._resume_pos = resume_pos
                             end_pos = idx + stream.tell()
                             return ContentSplit(
                                 prefix_text=content[:idx].strip(),
@@ -58,6 +144,8 @@ class JSONDetector:
             except IncompleteJSONError:
                 if seen_value:
                     # Partial JSON found; return the available tail
+                    self._resume_pos = resume_pos
+                    self._partial = self._start_partial(content, idx)
                     return ContentSplit(
                         prefix_text=content[:idx].strip(),
                         json_content=content[idx:],
@@ -71,6 +159,7 @@ class JSONDetector:
                 # Not valid JSON at this position; continue scanning
                 continue
 
+        self._resume_pos = len(content) if resume_pos is None else resume_pos
         return ContentSplit(
             prefix_text=content,
             json_content="",
@@ -79,12 +168,65 @@ class JSONDetector:
             is_complete_json=False,
         )
 
+    @classmethod
+    def _start_partial(cls, content: str, idx: int) -> Optional[_PartialJSON]:
+        """Feed the unfinished document at idx to a push parser to resume later.
+
+        Returns None when resuming could disagree with a full probe: the
+        document is invalid rather than truncated, or no value in it has been
+        parsed yet (the probe's verdict then hinges on the trailing token).
+        """
+        events = sendable_list()
+        partial = _PartialJSON(
+            start=idx,
+            parsed_len=idx,
+            depth=0,
+            parser=ijson.basic_parse_coro(events),
+            events=events,
+        )
+        if not cls._continue_partial(partial, content) or not partial.seen_value:
+            return None
+        return partial
+
+    @staticmethod
+    def _continue_partial(partial: _PartialJSON, content: str) -> bool:
+        """Feed the text appended since the last call to a suspended parser.
+
+        Returns True while the document is still unfinished, and False once
+        it has closed or turned out to be invalid.
+        """
+        try:
+            partial.parser.send(content[partial.parsed_len :].encode())
+        except (JSONError, UnicodeEncodeError):
+            return False
+        partial.parsed_len = len(content)
+
+        events = partial.events
+        depth = partial.depth
+        for event, _value in events:
+            if event in {"start_map", "start_array"}:
+                depth += 1
+            elif event in {"end_map", "end_array"}:
+                depth -= 1
+                if depth == 0:
+                    return False
+            else:
+                partial.seen_value = True
+        del events[:]
+        partial.depth = depth
+        return True
+
     def parse_json(self, json_str: str) -> Optional[Dict[str, Any]]:
-        """Parse JSON string using ijson."""
+        """Parse the first JSON value in a string.
+
+        The JSON is already in memory, so a single-shot parse is much cheaper
+        than driving ijson's event stream. Leading JSON whitespace is skipped
+        and trailing text is ignored.
+        """
 
         try:
-            return next(ijson.items(io.StringIO(json_str), ""))
-        except (JSONError, StopIteration):
+            return _DECODER.raw_decode(json_str, WHITESPACE.match(json_str).end())[0]
+        except ValueError:
             return None
 
 
@@ -0,0 +1,145 @@
+from typing import Iterator, List
+
+import pytest
+
+import agent.agent as agent_module
+from agent.agent import ModelOptions, SniffAgent, create_agent
+from agent.messaging import (
+    StreamChunkMessage,
+    StreamStartMessage,
+    ToolExecutionMessage,
+)
+
+
+class FakeSandbox:
+    def __init__(self, codebase_path: str) -> None:
+        self.codebase_path = codebase_path
+
+    def stop(self) -> None:
+        pass
+
+
+def assistant_turn(content: str = "", **function_call: str) -> dict:
+    message = {"role": "assistant", "content": content}
+    if function_call:
+        message["function_call"] = function_call
+    return message
+
+
+def function_result(name: str, content: str) -> dict:
+    return {"role": "function", "name": name, "content": content}
+
+
+def install_fake_llm(
+    monkeypatch: pytest.MonkeyPatch, batches: Iterator[List[dict]]
+) -> None:
+    """Make SniffAgent talk to an LLM that yields the given cumulative batches."""
+
+    class FakeAssistant:
+        def __init__(self, **kwargs) -> None:
+            pass
+
+        def run(self, messages: list) -> Iterator[List[dict]]:
+            yield from batches
+
+    monkeypatch.setattr(agent_module, "_load_assistant", lambda: FakeAssistant)
+    monkeypatch.setattr(agent_module, "Sandbox", FakeSandbox)
+
+
+def run_agent(monkeypatch: pytest.MonkeyPatch, batches: List[List[dict]]) -> list:
+    """Run SniffAgent and return the tool executions it sent."""
+    install_fake_llm(monkeypatch, batches)
+    agent, receiver = create_agent("codebase.zip")
+    agent.run_analysis()
+    receiver.close()
+    return [m for m in receiver if isinstance(m, ToolExecutionMessage)]
+
+
+def test_streamed_arguments_are_sent_once_complete(monkeypatch) -> None:
+    call = {"name": "ls", "arguments": '{"path": "src"}'}
+    batches = [
+        [assistant_turn(name="ls", arguments='{"pa')],
+        [assistant_turn(name="ls", arguments='{"path": "sr')],
+        [assistant_turn(**call)],
+        [assistant_turn(**call), function_result("ls", "app.py")],
+        [
+            assistant_turn(**call),
+            function_result("ls", "app.py"),
+            assistant_turn("Done"),
+        ],
+    ]
+
+    messages = run_agent(monkeypatch, batches)
+
+    assert len(messages) == 1
+    assert messages[0].tool_name == "ls"
+    assert messages[0].arguments == {"path": "src"}
+    assert messages[0].result == "app.py"
+
+
+def test_parallel_calls_pair_with_their_results(monkeypatch) -> None:
+    calls = [
+        assistant_turn(name="cat", arguments='{"filePath": "a.py"}'),
+        assistant_turn(name="ls", arguments='{"path": "."}'),
+        assistant_turn(name="cat", arguments='{"filePath": "b.py"}'),
+    ]
+    results = [
+        function_result("cat", "contents of a"),
+        function_result("ls", "a.py\nb.py"),
+        function_result("cat", "contents of b"),
+    ]
+    batches = [calls[:1], calls[:2], calls]
+    batches += [calls + results[:i] for i in range(1, len(results) + 1)]
+
+    messages = run_agent(monkeypatch, batches)
+
+    assert [(m.tool_name, m.arguments, m.result) for m in messages] == [
+        ("cat", {"filePath": "a.py"}, "contents of a"),
+        ("ls", {"path": "."}, "a.py\nb.py"),
+        ("cat", {"filePath": "b.py"}, "contents of b"),
+    ]
+
+
+def test_repeated_identical_calls_are_each_sent(monkeypatch) -> None:
+    call = assistant_turn(name="ls", arguments='{"path": "."}')
+    result = function_result("ls", "a.py")
+    batches = [
+        [call],
+        [call, result],
+        [call, result, call],
+        [call, result, call, result],
+        [call, result, call, result],
+    ]
+
+    messages = run_agent(monkeypatch, batches)
+
+    assert len(messages) == 2
+    for message in messages:
+        assert message.arguments == {"path": "."}
+        assert message.result == "a.py"
+
+
+def test_streamed_text_is_sent_before_the_next_batch(monkeypatch) -> None:
+    received = []
+
+    class RecordingReceiver:
+        def receive_message(self, message) -> None:
+            received.append(message)
+
+    def streamed_text() -> Iterator[List[dict]]:
+        yield [assistant_turn("Looking")]
+        yield [assistant_turn("Looking at the code")]
+        # The LLM may stall here; what was streamed so far must already be out
+        text = "".join(
+            m.initial_content if isinstance(m, StreamStartMessage) else m.content
+            for m in received
+            if isinstance(m, (StreamStartMessage, StreamChunkMessage))
+        )
+        assert text == "Looking at the code"
+        yield [assistant_turn("Looking at the code now")]
+
+    install_fake_llm(monkeypatch, streamed_text())
+    agent = SniffAgent(
+        "codebase.zip", ModelOptions.QWEN3_30B_A3B_INSTRUCT, RecordingReceiver()
+    )
+    agent.run_analysis()
@@ -0,0 +1,45 @@
+from agent.messaging import (
+    MessageReceiver,
+    StreamChunkMessage,
+    StreamEndMessage,
+    StreamStartMessage,
+)
+
+
+def chunk(index: int, content: str) -> StreamChunkMessage:
+    return StreamChunkMessage(
+        message_id=f"c{index}", timestamp=0, content=content, chunk_index=index
+    )
+
+
+def test_iteration_ends_after_close() -> None:
+    receiver = MessageReceiver()
+    start = StreamStartMessage(message_id="s", timestamp=0)
+    receiver.receive_message(start)
+    receiver.close()
+
+    assert list(receiver) == [start]
+    # A closed receiver stays closed
+    assert list(receiver) == []
+
+
+def test_queued_chunks_are_merged() -> None:
+    receiver = MessageReceiver()
+    start = StreamStartMessage(message_id="s", timestamp=0)
+    end = StreamEndMessage(message_id="e", timestamp=0)
+    for message in [start, chunk(0, "a"), chunk(1, "b"), chunk(2, "c"), end]:
+        receiver.receive_message(message)
+    receiver.receive_message(chunk(0, "d"))
+    receiver.close()
+
+    messages = list(receiver)
+
+    assert [type(m) for m in messages] == [
+        StreamStartMessage,
+        StreamChunkMessage,
+        StreamEndMessage,
+        StreamChunkMessage,
+    ]
+    assert messages[1].content == "abc"
+    assert messages[1].chunk_index == 0
+    assert messages[3].content == "d"
@@ -2,17 +2,19 @@
 Utilities for testing agent tools with sandboxed environments.
 """
 
-import os
-import shutil
+import hashlib
 import sys
 import tempfile
+import zipfile
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
 # Add src to path for imports
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+SRC_PATH = str(PROJECT_ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 from agent.sandbox import Sandbox
 
@@ -60,35 +62,52 @@ def custom_sandbox(workspace_files: dict):
             ls_tool = LsTool()
             result = ls_tool.call('{"path": "."}')
     """
-    # Create temporary workspace
-    temp_dir = tempfile.mkdtemp()
-    workspace_dir = Path(temp_dir) / "workspace"
-    workspace_dir.mkdir()
+    zip_path = _cached_workspace_zip(workspace_files)
+    sandbox = Sandbox(str(zip_path))
 
     try:
-        # Create all files and directories
-        for file_path, content in workspace_files.items():
-            full_path = workspace_dir / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content, encoding="utf-8")
-
-        # Create zip file
-        zip_path = Path(temp_dir) / "workspace.zip"
-        shutil.make_archive(str(zip_path.with_suffix("")), "zip", str(workspace_dir))
-
-        # Start sandbox
-        sandbox = Sandbox(str(zip_path))
-        container_id = sandbox.start()
+        # Start sandbox; start() cleans up its own container if it fails
+        _container_id = sandbox.start()
         yield sandbox
-
     finally:
-        if "sandbox" in locals():
-            sandbox.stop()
-        # Cleanup temp files
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass  # Best effort cleanup
+        sandbox.stop()
+
+
+# Zips built for custom sandboxes during this run; removed at interpreter exit
+_workspace_zip_dir: Optional[tempfile.TemporaryDirectory] = None
+
+
+def _cached_workspace_zip(workspace_files: dict) -> Path:
+    """
+    Zip workspace_files into this run's scratch directory, reusing an earlier archive.
+
+    The archive is keyed by a hash of the file table, so tests that share a
+    workspace skip rebuilding it. The directory belongs to this process and is
+    deleted when it exits, so no archive outlives the test run.
+    """
+    global _workspace_zip_dir
+    if _workspace_zip_dir is None:
+        _workspace_zip_dir = tempfile.TemporaryDirectory(prefix="sniff_workspaces_")
+
+    key = hashlib.blake2b(
+        repr(sorted(workspace_files.items())).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    zip_path = Path(_workspace_zip_dir.name) / f"workspace_{key}.zip"
+    if zip_path.exists():
+        return zip_path
+
+    try:
+        # Write the file table straight into the zip (stored, since the sandbox
+        # unpacks it locally right away); no need to stage files on disk first
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as zf:
+            for file_path, content in workspace_files.items():
+                zf.writestr(file_path, content.encode("utf-8"))
+    except Exception:
+        # Don't leave a partial archive behind for the next lookup to reuse
+        zip_path.unlink(missing_ok=True)
+        raise
+
+    return zip_path
 
 
 def get_toy_webserver_path() -> Path:
@@ -101,5 +120,5 @@ def setup_test_environment():
     Set up the test environment by adding src to Python path.
     Call this at the start of test files if needed.
     """
-    if str(PROJECT_ROOT / "src") not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT / "src"))
+    if SRC_PATH not in sys.path:
+        sys.path.insert(0, SRC_PATH)
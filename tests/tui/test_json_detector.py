@@ -0,0 +1,86 @@
+import json
+import random
+from typing import Iterator
+
+import pytest
+
+from tui.utils.json_detector import JSONDetector
+
+# The detector probes str streams with ijson, which warns about them on every call
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning:ijson.*")
+
+PIECES = [
+    "text ",
+    "{",
+    "}",
+    "[",
+    "]",
+    '"a"',
+    ":",
+    "1",
+    ",",
+    " {x} ",
+    '{"summary": "s", "bugs": []}',
+    "\n",
+    "[1, 2]",
+    "tru",
+    "e",
+    "\\",
+    "1e",
+]
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth > 3 or roll < 0.3:
+        return rng.choice([1, -2.5e3, 'quote " slash \\ é 😀 {x}', True, None, ""])
+    if roll < 0.65:
+        return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+    return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+
+
+def random_texts(rng: random.Random) -> Iterator[str]:
+    for _ in range(150):
+        yield "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 30)))
+    for _ in range(150):
+        document = json.dumps(random_value(rng), indent=rng.choice([None, 2]))
+        yield (
+            rng.choice(["", "Report {x}: ", "[oops "])
+            + document
+            + rng.choice(["", " trailing", " x}"])
+        )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_reused_detector_matches_fresh_detector(seed: int) -> None:
+    rng = random.Random(seed)
+    for text in random_texts(rng):
+        detector = JSONDetector()
+        end = 0
+        while end < len(text):
+            end = min(len(text), end + rng.randint(1, 6))
+            content = text[:end]
+            roll = rng.random()
+            if roll < 0.05:
+                # The model restarted its message
+                content = "reset " + content
+            elif roll < 0.1:
+                # The same content delivered twice
+                detector.split_content(content)
+
+            assert detector.split_content(content) == JSONDetector().split_content(
+                content
+            ), content
+
+
+def test_unfinished_report_completes() -> None:
+    detector = JSONDetector()
+    report = 'Done. {"summary": "s", "bugs": [{"line": 3}]}'
+    for end in range(1, len(report)):
+        split = detector.split_content(report[:end])
+        assert not split.is_complete_json
+
+    split = detector.split_content(report)
+    assert split.is_complete_json
+    assert split.prefix_text == "Done."
+    assert split.json_value == {"summary": "s", "bugs": [{"line": 3}]}